@@ -8,6 +8,10 @@ import os
 import sys
 import traceback
 import time
+import queue
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple
 
 # ---- Google Tasks deps (installed via pip) ----
@@ -23,6 +27,9 @@ GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET', 'client_secret.jso
 SCOPES = ['https://www.googleapis.com/auth/tasks']  # read/write
 DEBUG_LOG = 'sync.log'
 
+# (client_secret, token_file) -> (service, creds); discovery build() is expensive
+_service_cache = {}
+
 # ------------- Utilities -----------------
 
 def log_exception(e: Exception):
@@ -33,29 +40,53 @@ def log_exception(e: Exception):
     except Exception:
         pass  # never let logging crash the app
 
+_DATE_SEPARATORS = str.maketrans('. ', '//')
+
 def normalize_date(date_str):
-    date_str = date_str.strip()
-    date_str = date_str.replace('.', '/').replace(' ', '/')
-    return date_str
+    return date_str.strip().translate(_DATE_SEPARATORS)
+
+def cell_width(s: str) -> int:
+    """Terminal columns `s` takes up: wide (CJK, most emoji) chars use two, combining marks none."""
+    if s.isascii():
+        return len(s)
+    return sum(0 if unicodedata.combining(c) else 2 if unicodedata.east_asian_width(c) in 'WF' else 1
+               for c in s)
+
+def parse_mmdd(mmdd: str, year: Optional[int] = None) -> Optional[Tuple[int, int]]:
+    """
+    (month, day) if 'MM/DD' is a real date in `year` (default: this year), else None.
+    The dialog, the list view and mmdd_to_rfc3339 all parse dates through this.
+    """
+    try:
+        m, d = map(int, mmdd.split('/'))
+        datetime.date(year or datetime.date.today().year, m, d)
+    except (ValueError, OverflowError, AttributeError):
+        return None
+    return m, d
 
 def mmdd_to_rfc3339(mmdd: str, year: Optional[int] = None) -> Optional[str]:
     """
     Convert 'MM/DD' to RFC3339 midnight UTC for Google Tasks 'due'.
     If parse fails, return None.
     """
-    try:
-        if not year:
-            year = datetime.date.today().year
-        m, d = map(int, mmdd.split('/'))
-        dt = datetime.datetime(year, m, d, 0, 0, 0, tzinfo=datetime.timezone.utc)
-        return dt.isoformat().replace('+00:00', 'Z')
-    except Exception:
+    if not year:
+        year = datetime.date.today().year
+    parsed = parse_mmdd(mmdd, year)
+    if parsed is None:
         return None
+    dt = datetime.datetime(year, *parsed, 0, 0, 0, tzinfo=datetime.timezone.utc)
+    return dt.isoformat().replace('+00:00', 'Z')
 
 def rfc3339_to_mmdd(rfc: str) -> str:
     """
     Convert Google Tasks 'due' RFC3339 to 'MM/DD' (drop year in local DB semantics).
     """
+    # Fast path: Google always sends 'YYYY-MM-DDT00:00:00.000Z'
+    if len(rfc) >= 10 and rfc[4] == '-' and rfc[7] == '-':
+        try:
+            return f"{int(rfc[5:7])}/{int(rfc[8:10])}"
+        except ValueError:
+            pass
     try:
         dt = datetime.datetime.fromisoformat(rfc.replace('Z', '+00:00'))
         return f"{dt.month}/{dt.day}"
@@ -64,6 +95,9 @@ def rfc3339_to_mmdd(rfc: str) -> str:
 
 def notify_popup(stdscr, msg: str, wait_for_key=True):
     """Centered modal message so it won't get overwritten by the main loop."""
+    if isinstance(stdscr, queue.Queue):
+        _notify(stdscr, msg)
+        return
     if stdscr is None:
         print(msg)
         if wait_for_key:
@@ -86,23 +120,29 @@ def notify_popup(stdscr, msg: str, wait_for_key=True):
         if wait_for_key:
             footer = "Press any key…"
             win.addstr(box_h - 2, (box_w - len(footer)) // 2, footer)
-        win.refresh()
+        win.noutrefresh()
+        curses.doupdate()
         if wait_for_key:
             win.getch()
     except curses.error:
         _notify(stdscr, msg)
         if wait_for_key:
+            stdscr.timeout(-1)
             stdscr.getch()
 
 def _notify(stdscr, msg: str):
     if stdscr is None:
         print(msg)
         return
+    if isinstance(stdscr, queue.Queue):  # background sync: the UI thread shows it
+        stdscr.put(msg)
+        return
     try:
         h, w = stdscr.getmaxyx()
         stdscr.addstr(h-1, 0, " " * (w-1))
         stdscr.addstr(h-1, 0, msg[:w-1])
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
     except curses.error:
         pass
 
@@ -111,10 +151,21 @@ def _notify(stdscr, msg: str):
 def init_db(db_path: str):
     """
     Initialize the database and create/upgrade the tasks table with extra sync columns.
+    main() keeps the returned connection open for the whole session so SQLite's
+    page cache and prepared statements stay warm; only the sync thread opens another.
     """
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     cur = conn.cursor()
+
+    # WAL + synchronous=NORMAL: one WAL append per commit instead of rollback-journal fsyncs.
+    # Losing the last commit on power failure is an acceptable tradeoff for a desktop TUI.
+    cur.execute('PRAGMA journal_mode=WAL')
+    cur.execute('PRAGMA synchronous=NORMAL')
+    cur.execute('PRAGMA temp_store=MEMORY')
+    cur.execute('PRAGMA cache_size=-20000')     # ~20 MB page cache
+    cur.execute('PRAGMA mmap_size=268435456')   # 256 MB
+
     cur.execute('''
         CREATE TABLE IF NOT EXISTS tasks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -140,61 +191,97 @@ def init_db(db_path: str):
     add_col('updated', 'TEXT')     # Google 'updated' timestamp (RFC3339)
     add_col('dirty', 'INTEGER DEFAULT 0')  # local changes not pushed
 
-    # Ensure an index for google_id lookups
+    # Google ids of locally deleted tasks, to delete remotely on next push
+    cur.execute('CREATE TABLE IF NOT EXISTS deletions (google_id TEXT PRIMARY KEY)')
+    # Small key/value store for sync bookkeeping (e.g. 'last_sync')
+    cur.execute('CREATE TABLE IF NOT EXISTS sync_meta (key TEXT PRIMARY KEY, value TEXT)')
+    conn.commit()
+
+    # Ensure an index for google_id lookups, a partial index so the
+    # push scan (dirty=1 ORDER BY pos) never touches clean rows or sorts,
+    # and indexes so both get_tasks() orderings are index scans.
     try:
         cur.execute('CREATE INDEX IF NOT EXISTS idx_tasks_google_id ON tasks(google_id)')
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_tasks_dirty_pos ON tasks(dirty, pos) WHERE dirty=1')
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_tasks_pos ON tasks(pos)')
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_tasks_date ON tasks(completion_date)')
         conn.commit()
     except sqlite3.OperationalError:
         pass
 
+    # Keep pos contiguous (0..N-1) so a reorder only rewrites the rows that moved;
+    # delete_task closes its own gap, this repairs databases from older versions
+    cur.execute('SELECT id, pos FROM tasks ORDER BY pos, id')
+    renumber = [(i, tid) for i, (tid, pos) in enumerate(cur.fetchall()) if pos != i]
+    if renumber:
+        with conn:
+            cur.executemany('UPDATE tasks SET pos = ? WHERE id = ?', renumber)
+
     return conn
 
+# Task mutators (add/delete/reorder/toggle/edit) don't commit: callers wrap them in
+# `with conn:` so each user action is exactly one transaction.
+
 def add_task(conn, text, completion_date, details, mark_dirty=True):
     cur = conn.cursor()
-    cur.execute('SELECT COALESCE(MAX(pos), -1) FROM tasks')
-    max_pos = cur.fetchone()[0]
-    new_pos = max_pos + 1
     cur.execute('''
         INSERT INTO tasks (text, pos, completion_date, details, done, dirty)
-        VALUES (?, ?, ?, ?, 0, ?)
-    ''', (text, new_pos, completion_date, details, 1 if mark_dirty else 0))
-    conn.commit()
+        VALUES (?, COALESCE((SELECT MAX(pos) + 1 FROM tasks), 0), ?, ?, 0, ?)
+    ''', (text, completion_date, details, 1 if mark_dirty else 0))
+    return cur.lastrowid
 
 def delete_task(conn, task_id, mark_dirty=True):
     cur = conn.cursor()
-    cur.execute('SELECT google_id FROM tasks WHERE id=?', (task_id,))
+    cur.execute('SELECT google_id, pos FROM tasks WHERE id=?', (task_id,))
     row = cur.fetchone()
     if row and row[0]:
-        cur.execute('''CREATE TABLE IF NOT EXISTS deletions (
-            google_id TEXT PRIMARY KEY
-        )''')
         cur.execute('INSERT OR IGNORE INTO deletions(google_id) VALUES (?)', (row[0],))
-        conn.commit()
     cur.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
-    conn.commit()
+    if row:
+        # Close the gap; relative order is unchanged, so these rows stay clean
+        cur.execute('UPDATE tasks SET pos = pos - 1 WHERE pos > ?', (row[1],))
+
+# Whitelisted orderings for get_tasks(); anything else falls back to 'pos'
+_TASK_QUERIES = {
+    'pos': 'SELECT id, text, pos, completion_date, details, done FROM tasks ORDER BY pos',
+    'completion_date': 'SELECT id, text, pos, completion_date, details, done FROM tasks ORDER BY completion_date',
+}
 
 def get_tasks(conn, order_by='pos'):
     cur = conn.cursor()
-    if order_by == 'pos':
-        cur.execute('SELECT id, text, pos, completion_date, details, done FROM tasks ORDER BY pos')
-    elif order_by == 'completion_date':
-        cur.execute('SELECT id, text, pos, completion_date, details, done FROM tasks ORDER BY completion_date')
-    else:
-        cur.execute('SELECT id, text, pos, completion_date, details, done FROM tasks ORDER BY pos')
+    cur.execute(_TASK_QUERIES.get(order_by, _TASK_QUERIES['pos']))
     return cur.fetchall()
 
+def count_pending_changes(conn) -> int:
+    """Number of local edits and deletions not yet pushed to Google."""
+    cur = conn.cursor()
+    cur.execute('''
+        SELECT (SELECT COUNT(*) FROM tasks WHERE dirty=1) + (SELECT COUNT(*) FROM deletions)
+    ''')
+    return cur.fetchone()[0]
+
+def get_sync_meta(conn, key: str) -> Optional[str]:
+    cur = conn.cursor()
+    cur.execute('SELECT value FROM sync_meta WHERE key=?', (key,))
+    row = cur.fetchone()
+    return row[0] if row else None
+
+def set_sync_meta(conn, key: str, value: str):
+    cur = conn.cursor()
+    with conn:
+        cur.execute('INSERT OR REPLACE INTO sync_meta (key, value) VALUES (?, ?)', (key, value))
+
 def update_task_order(conn, tasks_order):
     cur = conn.cursor()
-    for new_pos, task in enumerate(tasks_order):
-        task_id = task[0]
-        cur.execute('UPDATE tasks SET pos = ?, dirty=1 WHERE id = ?', (new_pos, task_id))
-    conn.commit()
+    # One prepared statement for the renumbering; rows already at their
+    # new position (outside the span the task was dragged across) are skipped
+    cur.executemany('UPDATE tasks SET pos = ?, dirty=1 WHERE id = ?',
+                    [(new_pos, task[0]) for new_pos, task in enumerate(tasks_order)
+                     if task[2] != new_pos])
 
-def toggle_task_done(conn, task_id, current_done):
-    new_done = 0 if current_done else 1
+def toggle_task_done(conn, task_id):
     cur = conn.cursor()
-    cur.execute('UPDATE tasks SET done = ?, dirty=1 WHERE id = ?', (new_done, task_id))
-    conn.commit()
+    cur.execute('UPDATE tasks SET done = 1 - done, dirty=1 WHERE id = ?', (task_id,))
 
 def update_task_info(conn, task_id, text, completion_date, details):
     cur = conn.cursor()
@@ -203,7 +290,6 @@ def update_task_info(conn, task_id, text, completion_date, details):
         SET text = ?, completion_date = ?, details = ?, dirty = 1
         WHERE id = ?
     ''', (text, completion_date, details, task_id))
-    conn.commit()
 
 # ------------- Google OAuth / Service -----------------
 
@@ -230,15 +316,47 @@ def _find_token_path(path_hint: Optional[str]) -> str:
         return _resolve_path(path_hint)
     return _resolve_path(GOOGLE_TOKEN)
 
-def get_google_service(stdscr=None, client_secret_path: Optional[str] = None, token_path: Optional[str] = None):
+def _load_and_refresh_creds(token_file: str) -> Optional[Credentials]:
+    """
+    Load token_file and refresh it if expired. No UI, so it is safe to run on a
+    worker thread; returns None on any problem (logged to DEBUG_LOG).
+    """
+    try:
+        if not os.path.exists(token_file):
+            return None
+        creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+        if not creds.valid and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+            # Save it, or every later start pays for the same refresh again
+            with open(token_file, 'w') as token:
+                token.write(creds.to_json())
+        return creds if creds.valid else None
+    except Exception as e:
+        log_exception(e)
+        return None
+
+def _cached_service(client_secret: Optional[str], token_file: str):
+    """Service built earlier this session for these files, while its creds are still valid."""
+    cached = _service_cache.get((client_secret, token_file))
+    if cached and cached[1].valid:
+        return cached[0]
+    return None
+
+def get_google_service(stdscr=None, client_secret_path: Optional[str] = None, token_path: Optional[str] = None,
+                       creds: Optional[Credentials] = None):
     """
     Returns a Google Tasks API service.
     - Looks for client_secret.json in several locations or uses --client-secret path.
     - Saves token.json to the chosen token_path (or default).
+    - Pass already loaded/refreshed creds to skip reading the token file.
     """
     client_secret = _find_client_secret(client_secret_path)
     token_file = _find_token_path(token_path)
 
+    service = _cached_service(client_secret, token_file)
+    if service is not None:
+        return service
+
     if not client_secret:
         notify_popup(stdscr, "Missing client_secret.json\nEnable Tasks API and supply it via:\n"
                              "  - put client_secret.json next to this script, or\n"
@@ -246,8 +364,9 @@ def get_google_service(stdscr=None, client_secret_path: Optional[str] = None, to
                              "  - use --client-secret /path/to/client_secret.json")
         return None
 
-    creds = None
-    if os.path.exists(token_file):
+    if creds is not None and not creds.valid:
+        creds = None
+    if creds is None and os.path.exists(token_file):
         try:
             creds = Credentials.from_authorized_user_file(token_file, SCOPES)
         except Exception as e:
@@ -280,6 +399,7 @@ def get_google_service(stdscr=None, client_secret_path: Optional[str] = None, to
 
     try:
         service = build('tasks', 'v1', credentials=creds)
+        _service_cache[(client_secret, token_file)] = (service, creds)
         return service
     except Exception as e:
         log_exception(e)
@@ -292,6 +412,19 @@ def ensure_default_tasklist(service):
     # Use the user's default list (usually '@default')
     return '@default'
 
+BATCH_SIZE = 50  # Google recommends at most 50 calls per batch request
+
+def _execute_batched(service, requests, callback=None):
+    """
+    Send (request_id, HttpRequest) pairs through BatchHttpRequest, BATCH_SIZE per
+    HTTP round-trip. callback(request_id, response, exception) is called per item.
+    """
+    for i in range(0, len(requests), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, req in requests[i:i + BATCH_SIZE]:
+            batch.add(req, request_id=request_id)
+        batch.execute()
+
 def push_local_changes(conn, service, stdscr=None):
     """
     Push locally 'dirty' rows to Google (create/update). Push deletions too.
@@ -302,24 +435,33 @@ def push_local_changes(conn, service, stdscr=None):
         return
 
     tasklist = ensure_default_tasklist(service)
+    tasks_api = service.tasks()
     cur = conn.cursor()
 
     # Handle deletions first
-    cur.execute('''CREATE TABLE IF NOT EXISTS deletions (google_id TEXT PRIMARY KEY)''')
     cur.execute('SELECT google_id FROM deletions')
     to_delete = [row[0] for row in cur.fetchall()]
-    for gid in to_delete:
+    if to_delete:
         try:
-            service.tasks().delete(tasklist=tasklist, task=gid).execute()
+            _execute_batched(service, [
+                (gid, tasks_api.delete(tasklist=tasklist, task=gid))
+                for gid in to_delete
+            ])
         except Exception:
             pass  # already gone is fine
-    if to_delete:
         cur.execute('DELETE FROM deletions')
         conn.commit()
 
     # Push dirty items (create or update)
-    cur.execute('SELECT * FROM tasks WHERE dirty=1 ORDER BY pos')
+    cur.execute('''
+        SELECT id, text, completion_date, details, done, google_id
+        FROM tasks
+        WHERE dirty=1
+        ORDER BY pos
+    ''')
     rows = cur.fetchall()
+    titles = {}
+    requests = []
     for r in rows:
         rid = r['id']
         payload = {
@@ -336,48 +478,107 @@ def push_local_changes(conn, service, stdscr=None):
         else:
             payload['status'] = 'needsAction'
 
-        try:
-            if r['google_id']:
-                resp = service.tasks().patch(
-                    tasklist=tasklist,
-                    task=r['google_id'],
-                    body=payload
-                ).execute()
-            else:
-                resp = service.tasks().insert(
-                    tasklist=tasklist,
-                    body=payload
-                ).execute()
-
-            cur.execute('''
-                UPDATE tasks SET google_id=?, etag=?, updated=?, dirty=0 WHERE id=?
-            ''', (resp.get('id'), resp.get('etag'), resp.get('updated'), rid))
-            conn.commit()
-        except Exception as e:
-            log_exception(e)
-            _notify(stdscr, f"Push failed for task {r['text']}: {e}")
+        if r['google_id']:
+            req = tasks_api.patch(
+                tasklist=tasklist,
+                task=r['google_id'],
+                body=payload
+            )
+        else:
+            req = tasks_api.insert(
+                tasklist=tasklist,
+                body=payload
+            )
+        titles[str(rid)] = r['text']
+        requests.append((str(rid), req))
+
+    if not requests:
+        return
+
+    pushed = []
+
+    def on_response(request_id, resp, exception):
+        if exception is not None:
+            log_exception(exception)
+            _notify(stdscr, f"Push failed for task {titles[request_id]}: {exception}")
+            return
+        pushed.append((resp.get('id'), resp.get('etag'), resp.get('updated'), int(request_id)))
+
+    try:
+        _execute_batched(service, requests, on_response)
+    except Exception as e:
+        # Keep whatever earlier batches managed to push; the rest stays dirty
+        log_exception(e)
+        _notify(stdscr, f"Push failed: {e}")
+
+    with conn:
+        cur.executemany('''
+            UPDATE tasks SET google_id=?, etag=?, updated=?, dirty=0 WHERE id=?
+        ''', pushed)
+
+SYNC_CLOCK_SKEW = datetime.timedelta(minutes=1)  # slack for local vs Google clock
+
+def remote_changed_since(conn, service, since: str) -> bool:
+    """
+    Probe: has anything in the default list been created, edited, completed or
+    deleted at or after RFC3339 time 'since' by someone other than us?
+    Our own pushes and moves are recognised because their 'updated' stamps were
+    stored locally; deletions of tasks we no longer have are ours too.
+    """
+    cur = conn.cursor()
+    cur.execute('SELECT google_id, updated FROM tasks WHERE google_id IS NOT NULL')
+    local_updated = dict(cur.fetchall())
+
+    tasks_api = service.tasks()
+    tasklist = ensure_default_tasklist(service)
+    page_token = None
+    while True:
+        kwargs = {
+            'tasklist': tasklist,
+            'updatedMin': since,
+            'showCompleted': True,
+            'showHidden': True,
+            'showDeleted': True,
+            'fields': 'items(id,updated,deleted),nextPageToken'
+        }
+        if page_token:
+            kwargs['pageToken'] = page_token
+        resp = tasks_api.list(**kwargs).execute()
+        for item in resp.get('items', []):
+            gid = item.get('id')
+            if gid in local_updated:
+                if item.get('updated') != local_updated[gid]:
+                    return True
+            elif not item.get('deleted'):
+                return True  # created remotely
+        page_token = resp.get('nextPageToken')
+        if not page_token:
+            return False
 
 def pull_remote_changes(conn, service, stdscr=None):
     """
     Pull from Google and upsert into local DB, resolving conflicts by 'updated' timestamp.
     - Fetches completed and hidden tasks, so server-side completions are reflected locally.
     - Keeps local 'pos' ordering unless the item is new—then append to end.
+    Returns the remote items in server order so the order sync can reuse the listing.
     """
     if service is None:
-        return
+        return []
 
     tasklist = ensure_default_tasklist(service)
+    tasks_api = service.tasks()
     cur = conn.cursor()
 
-    # Build mapping: google_id -> local row
-    cur.execute('SELECT * FROM tasks')
-    local_rows = cur.fetchall()
+    # Build mapping: google_id -> (id, updated, dirty); positional unpacking avoids
+    # sqlite3.Row's by-name column lookup in this loop
+    cur.execute('SELECT id, pos, google_id, updated, dirty FROM tasks')
     local_by_gid = {}
     max_pos = -1
-    for r in local_rows:
-        max_pos = max(max_pos, r['pos'])
-        if r['google_id']:
-            local_by_gid[r['google_id']] = r
+    for lid, lpos, lgid, lupdated, ldirty in cur.fetchall():
+        if lpos > max_pos:
+            max_pos = lpos
+        if lgid:
+            local_by_gid[lgid] = (lid, lupdated, ldirty)
 
     # Pull all tasks, including completed & hidden
     page_token = None
@@ -387,18 +588,22 @@ def pull_remote_changes(conn, service, stdscr=None):
             'tasklist': tasklist,
             'showDeleted': False,
             'showCompleted': True,
-            'showHidden': True
+            'showHidden': True,
+            # Partial response: only the fields reconciliation reads
+            'fields': 'items(id,title,notes,due,status,updated,etag),nextPageToken'
         }
         if page_token:
             kwargs['pageToken'] = page_token
-        resp = service.tasks().list(**kwargs).execute()
+        resp = tasks_api.list(**kwargs).execute()
         items = resp.get('items', [])
         remote_items.extend(items)
         page_token = resp.get('nextPageToken')
         if not page_token:
             break
 
-    # Upsert / reconcile
+    # Upsert / reconcile (collect rows, then write them in one transaction)
+    to_update = []
+    to_insert = []
     for item in remote_items:
         gid = item.get('id')
         title = item.get('title', '')
@@ -412,14 +617,15 @@ def pull_remote_changes(conn, service, stdscr=None):
         done = 1 if status == 'completed' else 0
 
         if gid in local_by_gid:
-            local = local_by_gid[gid]
-            local_updated = local['updated']
-            local_dirty = local['dirty']
+            local_id, local_updated, local_dirty = local_by_gid[gid]
 
             should_pull = False
             if not local_dirty:
                 if not local_updated:
                     should_pull = True
+                elif updated and len(updated) == len(local_updated) and updated[-1] == local_updated[-1] == 'Z':
+                    # Same fixed-width UTC form: string order is time order
+                    should_pull = updated > local_updated
                 else:
                     try:
                         ru = datetime.datetime.fromisoformat(updated.replace('Z', '+00:00')) if updated else None
@@ -430,19 +636,25 @@ def pull_remote_changes(conn, service, stdscr=None):
                         should_pull = True
 
             if should_pull:
-                cur.execute('''
-                    UPDATE tasks
-                    SET text=?, details=?, completion_date=?, done=?, etag=?, updated=?, dirty=0
-                    WHERE id=?
-                ''', (title, notes, mmdd, done, etag, updated, local['id']))
-                conn.commit()
+                to_update.append((title, notes, mmdd, done, etag, updated, local_id))
         else:
             max_pos += 1
-            cur.execute('''
+            to_insert.append((title, max_pos, mmdd, notes, done, gid, etag, updated))
+
+    with conn:
+        if to_update:
+            cur.executemany('''
+                UPDATE tasks
+                SET text=?, details=?, completion_date=?, done=?, etag=?, updated=?, dirty=0
+                WHERE id=?
+            ''', to_update)
+        if to_insert:
+            cur.executemany('''
                 INSERT INTO tasks (text, pos, completion_date, details, done, google_id, etag, updated, dirty)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
-            ''', (title, max_pos, mmdd, notes, done, gid, etag, updated))
-            conn.commit()
+            ''', to_insert)
+
+    return remote_items
 
 # ---- Minimal-move reordering using LIS ---------------------------------------
 
@@ -456,23 +668,21 @@ def _lis_indices(seq: List[int]) -> List[int]:
 
     # tails[k] = index in seq of the smallest tail of all increasing subsequences of length k+1
     tails: List[int] = []
+    # tail_vals[k] = seq[tails[k]], kept in step so bisect never rebuilds a list
+    tail_vals: List[int] = []
     prev: List[Optional[int]] = [None] * len(seq)
-    # positions[k] = seq index where LIS of length k+1 ends
-    positions: List[int] = []
 
     from bisect import bisect_left
 
     for i, x in enumerate(seq):
-        # Find insertion point in tails using current values
-        vals = [seq[t] for t in tails]
-        j = bisect_left(vals, x)
+        j = bisect_left(tail_vals, x)
+        prev[i] = tails[j-1] if j > 0 else None
         if j == len(tails):
             tails.append(i)
-            positions.append(i)
+            tail_vals.append(x)
         else:
             tails[j] = i
-            positions[j] = i
-        prev[i] = tails[j-1] if j > 0 else None
+            tail_vals[j] = x
 
     # Reconstruct indices from last tail
     lis_end = tails[-1]
@@ -486,12 +696,14 @@ def _lis_indices(seq: List[int]) -> List[int]:
 def _fetch_remote_order_ids(service, tasklist: str, id_filter: set) -> List[str]:
     """Return remote task IDs in their current Google order, filtered to id_filter."""
     ordered = []
+    tasks_api = service.tasks()
     page_token = None
     while True:
-        kwargs = dict(tasklist=tasklist, showCompleted=True, showHidden=True, showDeleted=False)
+        kwargs = dict(tasklist=tasklist, showCompleted=True, showHidden=True, showDeleted=False,
+                      fields='items(id),nextPageToken')
         if page_token:
             kwargs['pageToken'] = page_token
-        resp = service.tasks().list(**kwargs).execute()
+        resp = tasks_api.list(**kwargs).execute()
         for it in resp.get('items', []):
             gid = it.get('id')
             if gid and gid in id_filter:
@@ -508,7 +720,8 @@ def ensure_remote_order_matches_local_min_moves(
     tasklist='@default',
     dry_run=False,
     move_limit=None,
-    sleep_between=0.15
+    sleep_between=0.15,
+    remote_items=None
 ):
     """
     Minimize moves by computing an LIS of the remote order mapped into desired local order.
@@ -520,49 +733,54 @@ def ensure_remote_order_matches_local_min_moves(
       3) Map each remote ID -> desired index; create sequence of desired indices.
       4) Compute LIS of that sequence -> those are already in correct relative order.
       5) Iterate desired_ids top→bottom, moving only IDs not in LIS, placing after last placed.
+
+    Pass remote_items (as returned by pull_remote_changes) to skip re-listing the tasklist.
+    Returns the number of moves that were needed but not made (failures, move_limit).
     """
     if service is None:
-        return
+        return 0
 
     cur = conn.cursor()
     cur.execute('''
-        SELECT google_id, text
+        SELECT google_id
         FROM tasks
         WHERE google_id IS NOT NULL
         ORDER BY pos ASC
     ''')
-    rows = cur.fetchall()
-    desired_ids = [r['google_id'] for r in rows]
+    desired_ids = [r[0] for r in cur.fetchall()]
     if not desired_ids:
         _notify(stdscr, "Order sync: no Google-linked tasks to reorder.")
-        return
+        return 0
 
-    desired_set = set(desired_ids)
-    remote_in_desired = _fetch_remote_order_ids(service, tasklist, desired_set)
+    # Map desired_id -> desired index (doubles as the membership filter)
+    desired_index = {gid: i for i, gid in enumerate(desired_ids)}
+    if remote_items is None:
+        remote_in_desired = _fetch_remote_order_ids(service, tasklist, desired_index)
+    else:
+        remote_in_desired = [it.get('id') for it in remote_items if it.get('id') in desired_index]
 
-    # Some tasks might be missing remotely; filter desired_ids to those that exist remotely
-    remote_set = set(remote_in_desired)
-    filtered_desired_ids = [gid for gid in desired_ids if gid in remote_set]
-    if not filtered_desired_ids:
+    # Sequence of desired indices in current remote order. Indices of tasks missing
+    # remotely are simply absent; gaps don't change which subsequences are increasing.
+    seq = [desired_index[gid] for gid in remote_in_desired]
+    if not seq:
         _notify(stdscr, "Order sync: none of the desired tasks exist remotely; skipping.")
-        return
-
-    # Map desired_id -> desired index
-    desired_index = {gid: i for i, gid in enumerate(filtered_desired_ids)}
-
-    # Build sequence of desired indices in current remote order (only those present in filtered_desired_ids)
-    seq = [desired_index[gid] for gid in remote_in_desired if gid in desired_index]
+        return 0
+    filtered_desired_ids = [desired_ids[i] for i in sorted(seq)]
 
     # Compute LIS over 'seq' -> returns indices into 'seq'; translate back to remote_in_desired gids
     lis_seq_indices = _lis_indices(seq)
     lis_gids = {remote_in_desired[i] for i in lis_seq_indices}
 
     # Now walk the target desired order; place only items not in LIS.
+    tasks_api = service.tasks()
     moves_done = 0
+    moves_missed = 0
+    moved = []  # (etag, updated, gid) from move responses, so the next probe knows them
     anchor = None  # last placed gid in final order
-    for gid in filtered_desired_ids:
+    for pos_i, gid in enumerate(filtered_desired_ids):
         if move_limit is not None and moves_done >= move_limit:
             _notify(stdscr, f"Order sync: hit move_limit ({move_limit}); stopping early.")
+            moves_missed += sum(1 for g in filtered_desired_ids[pos_i:] if g not in lis_gids)
             break
 
         # If gid is already in LIS, treat it as placed without moving (just advance anchor)
@@ -578,10 +796,12 @@ def ensure_remote_order_matches_local_min_moves(
                     _notify(stdscr, f"[dry-run] would move {gid} to top")
             else:
                 if anchor:
-                    service.tasks().move(tasklist=tasklist, task=gid, previous=anchor).execute()
+                    resp = tasks_api.move(tasklist=tasklist, task=gid, previous=anchor).execute()
                 else:
-                    service.tasks().move(tasklist=tasklist, task=gid).execute()
+                    resp = tasks_api.move(tasklist=tasklist, task=gid).execute()
                 moves_done += 1
+                if resp:
+                    moved.append((resp.get('etag'), resp.get('updated'), gid))
                 if sleep_between:
                     time.sleep(sleep_between)
         except Exception as e:
@@ -590,56 +810,125 @@ def ensure_remote_order_matches_local_min_moves(
             try:
                 time.sleep(0.6)
                 if anchor:
-                    service.tasks().move(tasklist=tasklist, task=gid, previous=anchor).execute()
+                    resp = tasks_api.move(tasklist=tasklist, task=gid, previous=anchor).execute()
                 else:
-                    service.tasks().move(tasklist=tasklist, task=gid).execute()
+                    resp = tasks_api.move(tasklist=tasklist, task=gid).execute()
                 moves_done += 1
+                if resp:
+                    moved.append((resp.get('etag'), resp.get('updated'), gid))
             except Exception as e2:
                 log_exception(e2)
                 _notify(stdscr, f"Order sync: move failed for {gid}: {e2}")
+                moves_missed += 1
 
         anchor = gid
 
+    if moved:
+        with conn:
+            cur.executemany('''
+                UPDATE tasks SET etag=COALESCE(?, etag), updated=COALESCE(?, updated) WHERE google_id=?
+            ''', moved)
+
     _notify(stdscr, f"Order sync (min-moves) complete. Moves issued: {moves_done} (kept {len(lis_gids)} in place).")
+    return moves_missed
 
 def full_sync(conn, stdscr=None, client_secret_path: Optional[str] = None, token_path: Optional[str] = None):
     """
     Bi-directional sync: push local dirty first, then pull remote changes,
     then align remote order to match local 'pos' with minimal moves.
     """
-    service = get_google_service(stdscr, client_secret_path, token_path)
+    token_file = _find_token_path(token_path)
+    service = _cached_service(_find_client_secret(client_secret_path), token_file)
+    if service is not None:
+        pending = count_pending_changes(conn)
+    else:
+        # Load/refresh the OAuth token (network) while the local DB is scanned
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            creds_future = executor.submit(_load_and_refresh_creds, token_file)
+            pending = count_pending_changes(conn)
+            creds = creds_future.result()
+        if creds is None:
+            # Signing in again needs popups and a browser, which belong to the UI thread
+            raise RuntimeError("Google token missing, expired or revoked.\nPress G to sign in again.")
+        service = get_google_service(stdscr, client_secret_path, token_path, creds=creds)
     if not service:
         _notify(stdscr, "Google service unavailable (OAuth not done?).")
         return
-    _notify(stdscr, "Sync: pushing local changes…")
+
+    # Nothing to push and nothing touched remotely since the last sync: skip the full listing
+    last_sync = get_sync_meta(conn, 'last_sync')
+    if not pending and last_sync and not remote_changed_since(conn, service, last_sync):
+        _notify(stdscr, "Sync: already up to date.")
+        return
+    # Marked before listing (minus skew) so edits made mid-sync are seen next time
+    sync_started = (datetime.datetime.now(datetime.timezone.utc) - SYNC_CLOCK_SKEW).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    _notify(stdscr, f"Sync: pushing {pending} local change(s)…")
     push_local_changes(conn, service, stdscr)
     _notify(stdscr, "Sync: pulling remote changes…")
-    pull_remote_changes(conn, service, stdscr)
+    remote_items = pull_remote_changes(conn, service, stdscr)
 
     _notify(stdscr, "Sync: aligning Google order (min moves)…")
-    ensure_remote_order_matches_local_min_moves(
+    moves_missed = ensure_remote_order_matches_local_min_moves(
         conn,
         service,
         stdscr=stdscr,
         tasklist=ensure_default_tasklist(service),
         dry_run=False,          # set True to preview without changes
         move_limit=None,        # cap if you ever need to
-        sleep_between=0.12
+        sleep_between=0.12,
+        remote_items=remote_items
     )
 
+    if moves_missed:
+        # Remote order is still off; forget last_sync so the next sync can't short-circuit
+        set_sync_meta(conn, 'last_sync', '')
+    else:
+        set_sync_meta(conn, 'last_sync', sync_started)
     _notify(stdscr, "Sync complete.")
 
+def full_sync_in_background(db_path: str, client_secret_path: Optional[str], token_path: Optional[str],
+                            status: queue.Queue):
+    """
+    Thread target for full_sync. Uses its own connection (sqlite3 connections
+    stay on the thread that made them) and posts progress text to `status`;
+    an exception that ends the sync is posted as the last item.
+    """
+    conn = None
+    try:
+        conn = init_db(db_path)
+        full_sync(conn, status, client_secret_path, token_path)
+    except Exception as e:
+        log_exception(e)
+        status.put(e)
+    finally:
+        if conn is not None:
+            conn.close()
+
 # ------------- Curses UI -----------------
 
 def input_task(stdscr, prompt):
     curses.echo()
+    stdscr.timeout(-1)  # main() polls with a timeout; the prompt must wait for Enter
     stdscr.addstr(curses.LINES - 1, 0, " " * (curses.COLS - 1))
     stdscr.addstr(curses.LINES - 1, 0, prompt)
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    curses.doupdate()
     text = stdscr.getstr(curses.LINES - 1, len(prompt)).decode('utf-8')
     curses.noecho()
     return text
 
+def key_pending(win) -> bool:
+    """True if another keypress is already queued (e.g. a held arrow key)."""
+    win.nodelay(True)
+    try:
+        key = win.getch()
+    finally:
+        win.nodelay(False)
+    if key == -1:
+        return False
+    curses.ungetch(key)
+    return True
+
 def new_task_dialog(stdscr):
     return dialog_template(stdscr, "", "", "", "New Task")
 
@@ -653,32 +942,56 @@ def dialog_template(stdscr, init_text, init_date, init_details, title):
     win = curses.newwin(dh, dw, dy, dx)
     win.keypad(True)
 
-    fields = [init_text, init_date, init_details]
+    # Fields are edited as lists of characters: append/pop are O(1), and drawing
+    # joins only the slice that fits on screen.
+    fields = [list(init_text), list(init_date), list(init_details)]
     prompts = ["Task:", "Completion Date (MM/DD):", "Task Details:"]
     current_field = 0
+    btn_y = dh - 3
+    ok_label = "[ OK ]"
+    cancel_label = "[ CANCEL ]"
+    ok_x = dw // 2 - len(ok_label) - 2
+    cancel_x = dw // 2 + 2
+
+    # Only the field being edited, and the old/new focus on a move, are
+    # redrawn per key; the frame, title and prompts are drawn once.
+    def draw_field(i):
+        field_x = 2 + len(prompts[i]) + 1
+        width = dw - field_x - 2
+        content = fields[i]
+        if current_field == i:
+            # keep the end of the text, where typing happens, in view
+            win.addstr(2 + i*2, field_x, ''.join(content[-width:]).ljust(width), curses.A_REVERSE)
+        else:
+            win.addstr(2 + i*2, field_x, ''.join(content[:width]).ljust(width))
 
-    while True:
-        win.clear()
-        win.border()
-        win.addstr(0, (dw - len(title)) // 2, title, curses.A_BOLD)
-        for i, prompt in enumerate(prompts):
-            win.addstr(2 + i*2, 2, prompt)
-            content = fields[i]
-            field_x = 2 + len(prompt) + 1
-            if current_field == i:
-                win.addstr(2 + i*2, field_x, content + " " * (dw - field_x - 2 - len(content)), curses.A_REVERSE)
-            else:
-                win.addstr(2 + i*2, field_x, content)
-        btn_y = dh - 3
-        ok_label = "[ OK ]"
-        cancel_label = "[ CANCEL ]"
-        ok_x = dw // 2 - len(ok_label) - 2
-        cancel_x = dw // 2 + 2
+    def draw_buttons():
         win.addstr(btn_y, ok_x, ok_label, curses.A_REVERSE if current_field == 3 else curses.A_NORMAL)
         win.addstr(btn_y, cancel_x, cancel_label, curses.A_REVERSE if current_field == 4 else curses.A_NORMAL)
+
+    def draw_focus(i):
+        if i < 3:
+            draw_field(i)
+        else:
+            draw_buttons()
+
+    win.border()
+    win.addstr(0, (dw - len(title)) // 2, title, curses.A_BOLD)
+    for i, prompt in enumerate(prompts):
+        win.addstr(2 + i*2, 2, prompt)
+        draw_field(i)
+    draw_buttons()
+
+    error_shown = False
+
+    while True:
         win.refresh()
+        prev_field = current_field
 
         key = win.getch()
+        if error_shown:
+            win.addstr(btn_y + 1, 1, " " * (dw - 2))
+            error_shown = False
         if key in (9, curses.KEY_DOWN):
             current_field = (current_field + 1) % 5
         elif key == curses.KEY_UP:
@@ -688,19 +1001,32 @@ def dialog_template(stdscr, init_text, init_date, init_details, title):
                 current_field = (current_field + 1) % 5
             elif key in [curses.KEY_BACKSPACE, 127, 8]:
                 if fields[current_field]:
-                    fields[current_field] = fields[current_field][:-1]
+                    fields[current_field].pop()
             elif 32 <= key <= 126:
-                fields[current_field] += chr(key)
+                fields[current_field].append(chr(key))
         else:
             if key in [curses.KEY_ENTER, 10, 13]:
                 if current_field == 3:
-                    return tuple(fields)
+                    date = normalize_date(''.join(fields[1]))
+                    if date and parse_mmdd(date) is None:
+                        # Reject here rather than show it as due today / push it without a due date
+                        error = "Invalid date; use MM/DD (or leave it empty)"
+                        win.addstr(btn_y + 1, (dw - len(error)) // 2, error, curses.A_BOLD)
+                        error_shown = True
+                        current_field = 1
+                    else:
+                        return tuple(''.join(f) for f in fields)
                 else:
                     return None
 
+        if current_field != prev_field:
+            draw_focus(prev_field)
+        draw_focus(current_field)
+
 def main(stdscr, db_path, client_secret_path=None, token_path=None):
     conn = init_db(db_path)
     curses.curs_set(0)
+    stdscr.leaveok(True)  # cursor is hidden; don't spend output parking it
     curses.start_color()
     curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)
     curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
@@ -714,6 +1040,25 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
     else:
         curses.init_pair(6, curses.COLOR_WHITE, curses.COLOR_BLACK)
 
+    # Resolve attributes once instead of per row per frame
+    color_red = curses.color_pair(1)
+    color_yellow = curses.color_pair(2)
+    color_green = curses.color_pair(3)
+    color_cyan = curses.color_pair(5)
+    color_done = curses.color_pair(6)
+    color_text = curses.color_pair(4) | curses.A_BOLD
+    color_match = curses.color_pair(7) | curses.A_BOLD
+    # (text, details, date) attributes for [plain, selected, being moved] rows,
+    # keyed by (done, date colour)
+    row_styles = {}
+    for done_flag, text_color in ((0, color_text), (1, color_done)):
+        for date_color in (color_red, color_cyan):
+            row_styles[done_flag, date_color] = (
+                (text_color, curses.A_NORMAL, date_color),
+                (text_color | curses.A_REVERSE, curses.A_REVERSE, date_color | curses.A_REVERSE),
+                (text_color | curses.A_UNDERLINE, curses.A_NORMAL, date_color | curses.A_UNDERLINE),
+            )
+
     if not _find_client_secret(client_secret_path):
         _notify(stdscr, "Tip: supply client_secret.json (flag/env/cwd). Press G to test OAuth.")
 
@@ -727,21 +1072,87 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
     search_matches = []  # indices of matching tasks
     search_match_idx = 0  # which match we're on
     pre_search_selection = 0
+    task_cache = None  # rows from get_tasks, reused until a mutation invalidates them
+    task_cache_order = None
+    row_meta_cache = {}  # comp_date -> (delta_days, status, status_style, base_date_color, days_field); valid for meta_day
+    row_str_cache = {}  # (idx, text, details, comp_date) -> (text_part, details_part, date_part, cell widths)
+    meta_day = None
+    sync_thread = None  # running full_sync_in_background, if any
+    sync_status = queue.Queue()  # progress messages / final exception from sync_thread
+    sync_error = None
+    status_line = ""  # latest sync progress, shown on the bottom line
+    # Keys that write to the DB or use the Google service wait until the sync is done
+    sync_locked_keys = {ord('a'), ord('d'), ord('e'), ord(' '), ord('g'), ord('G'),
+                        curses.KEY_DC, curses.KEY_BACKSPACE, 127, curses.KEY_ENTER, 10, 13}
+
+    def invalidate_task_cache():
+        nonlocal task_cache
+        task_cache = None
+        row_str_cache.clear()
+
+    # Screen damage tracking: only rows whose content changed are repainted.
+    # Popups/dialogs draw over stdscr behind its back, so they force a full redraw;
+    # erase() (not clear()) lets ncurses diff that redraw against the real screen.
+    prev_rows = {}  # screen row -> key of what was last drawn there
+    prev_instruction = None
+    prev_status_line = None
+    prev_size = None
+    full_redraw = True
+    dirty_ui = True  # something visible changed since the last paint
 
     while True:
-        stdscr.clear()
+        # Pick up background sync progress, and report the outcome once it exits
+        if sync_thread is not None:
+            finished = not sync_thread.is_alive()
+            while not sync_status.empty():
+                msg = sync_status.get_nowait()
+                if isinstance(msg, Exception):
+                    sync_error = msg
+                else:
+                    status_line = msg
+                dirty_ui = True
+            if finished:
+                sync_thread = None
+                status_line = ""
+                invalidate_task_cache()
+                if sync_error is not None:
+                    notify_popup(stdscr, f"Sync error:\n{sync_error}\nSee {DEBUG_LOG}")
+                    sync_error = None
+                else:
+                    notify_popup(stdscr, "Sync complete.")
+                full_redraw = True
+
         max_y, max_x = stdscr.getmaxyx()
+        if full_redraw or (max_y, max_x) != prev_size:
+            stdscr.erase()
+            prev_rows.clear()
+            prev_instruction = None
+            prev_status_line = None
+            prev_size = (max_y, max_x)
+            full_redraw = False
+            dirty_ui = True
         visible_tasks = (max_y - 2) // 2
         if visible_tasks < 1:
             stdscr.clear()
             stdscr.addstr(0, 0, "Terminal too small! Please enlarge the window.")
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
+            full_redraw = True
+            stdscr.timeout(-1)  # nothing to tick here; don't re-clear every poll
             key = stdscr.getch()
             if key == ord('q'):
+                if sync_thread is not None:
+                    sync_thread.join()
                 break
             continue
 
-        tasks = reorder_list if moving_task_index is not None else get_tasks(conn, current_order)
+        if moving_task_index is not None:
+            tasks = reorder_list
+        else:
+            if task_cache is None or task_cache_order != current_order:
+                task_cache = get_tasks(conn, current_order)
+                task_cache_order = current_order
+            tasks = task_cache
         num_tasks = len(tasks)
         if current_selection >= num_tasks:
             current_selection = num_tasks - 1
@@ -753,113 +1164,143 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
         elif current_selection >= scroll_offset + visible_tasks:
             scroll_offset = current_selection - visible_tasks + 1
 
-        today = datetime.date.today()
-        current_year = today.year
-
-        for idx in range(scroll_offset, min(num_tasks, scroll_offset + visible_tasks)):
-            task = tasks[idx]
-            task_id, text, pos, comp_date, details, done = task
-            try:
-                month, day = map(int, comp_date.split('/'))
-                due_date = datetime.date(current_year, month, day)
-            except Exception:
-                due_date = today
-
-            delta_days = (due_date - today).days
-            if delta_days < 0:
-                status = "Overdue"
-                status_color = curses.color_pair(1)
-            elif delta_days <= 4:
-                status = "Needs Attention Now"
-                status_color = curses.color_pair(2)
-            else:
-                status = " "
-                status_color = curses.color_pair(3)
-
-            text_part = f"{idx + 1}. {text}"
-            details_part = f" | {details} | "
-            date_part = f"{comp_date} | "
-
-            if delta_days > 0:
-                days_field = f"{delta_days} days left | "
-            elif delta_days < 0:
-                days_field = f"{abs(delta_days)} days ago | "
-            else:
-                days_field = "Today | "
-
-            row = (idx - scroll_offset) * 2
-            base_date_color = curses.color_pair(1) if (0 <= delta_days <= 4) else curses.color_pair(5)
-            task_text_color = curses.color_pair(6) if done else curses.color_pair(4) | curses.A_BOLD
-
-            if moving_task_index is not None and idx == moving_task_index:
-                text_style = task_text_color | curses.A_UNDERLINE
-                details_style = curses.A_NORMAL
-                date_style = base_date_color | curses.A_UNDERLINE
-            elif idx == current_selection:
-                text_style = task_text_color | curses.A_REVERSE
-                details_style = curses.A_REVERSE
-                date_style = base_date_color | curses.A_REVERSE
-            else:
-                text_style = task_text_color
-                details_style = curses.A_NORMAL
-                date_style = base_date_color
-
-            try:
-                # Render task text with search highlighting
-                if search_mode and search_query and search_query.lower() in text.lower():
-                    # Draw text_part with highlighted matches
-                    col = 0
-                    prefix = f"{idx + 1}. "
-                    stdscr.addstr(row, col, prefix, text_style)
-                    col += len(prefix)
-                    lower_text = text.lower()
-                    lower_q = search_query.lower()
-                    i = 0
-                    while i < len(text):
-                        match_pos = lower_text.find(lower_q, i)
-                        if match_pos == -1:
-                            stdscr.addstr(row, col, text[i:], text_style)
-                            col += len(text) - i
-                            break
-                        if match_pos > i:
-                            stdscr.addstr(row, col, text[i:match_pos], text_style)
-                            col += match_pos - i
-                        stdscr.addstr(row, col, text[match_pos:match_pos+len(search_query)], curses.color_pair(7) | curses.A_BOLD)
-                        col += len(search_query)
-                        i = match_pos + len(search_query)
+        # Paint only when state changed; unhandled keys skip straight back to getch().
+        # While keys are still queued (autorepeat), apply them all and paint once.
+        if dirty_ui and not key_pending(stdscr):
+            today = datetime.date.today()
+            if today != meta_day:
+                row_meta_cache.clear()
+                meta_day = today
+                current_year = today.year
+                today_ordinal = today.toordinal()
+
+            for idx in range(scroll_offset, min(num_tasks, scroll_offset + visible_tasks)):
+                task = tasks[idx]
+                task_id, text, pos, comp_date, details, done = task
+                meta = row_meta_cache.get(comp_date)
+                if meta is None:
+                    parsed = parse_mmdd(comp_date, current_year)
+                    # unparseable dates count as due today
+                    delta_days = (datetime.date(current_year, *parsed).toordinal() - today_ordinal
+                                  if parsed else 0)
+                    if delta_days < 0:
+                        status = "Overdue"
+                        status_color = color_red
+                    elif delta_days <= 4:
+                        status = "Needs Attention Now"
+                        status_color = color_yellow
+                    else:
+                        status = " "
+                        status_color = color_green
+                    base_date_color = color_red if (0 <= delta_days <= 4) else color_cyan
+                    if delta_days > 0:
+                        days_field = f"{delta_days} days left | "
+                    elif delta_days < 0:
+                        days_field = f"{abs(delta_days)} days ago | "
+                    else:
+                        days_field = "Today | "
+                    meta = row_meta_cache[comp_date] = (delta_days, status, status_color | curses.A_BOLD,
+                                                         base_date_color, days_field)
+                delta_days, status, status_style, base_date_color, days_field = meta
+
+                str_key = (idx, text, details, comp_date)
+                parts = row_str_cache.get(str_key)
+                if parts is None:
+                    text_part, details_part, date_part = f"{idx + 1}. {text}", f" | {details} | ", f"{comp_date} | "
+                    # Spans are recoloured by screen column, so keep widths in cells, not characters
+                    text_w = cell_width(text_part)
+                    parts = row_str_cache[str_key] = (text_part, details_part, date_part, text_w,
+                                                      text_w + cell_width(details_part), cell_width(date_part))
+                text_part, details_part, date_part, text_w, x_date, date_w = parts
+
+                row = (idx - scroll_offset) * 2
+                if moving_task_index is not None and idx == moving_task_index:
+                    row_state = 2
+                elif idx == current_selection:
+                    row_state = 1
                 else:
-                    stdscr.addstr(row, 0, text_part, text_style)
-                stdscr.addstr(row, len(text_part), details_part, details_style)
-                stdscr.addstr(row, len(text_part) + len(details_part), date_part, date_style)
-                stdscr.addstr(row, len(text_part) + len(details_part) + len(date_part), days_field, date_style)
-                stdscr.addnstr(
-                    row,
-                    len(text_part) + len(details_part) + len(date_part) + len(days_field),
-                    status,
-                    max_x - (len(text_part) + len(details_part) + len(date_part) + len(days_field)),
-                    status_color | curses.A_BOLD
-                )
-                stdscr.addstr(row + 1, 0, "-" * (max_x - 1))
-            except curses.error:
-                pass
+                    row_state = 0
+                text_style, details_style, date_style = row_styles[1 if done else 0, base_date_color][row_state]
 
-        if search_mode:
-            search_line = f"/{search_query}"
-            match_info = f"  [{search_match_idx+1}/{len(search_matches)}]" if search_matches else "  [no matches]"
-            instruction = search_line + match_info
-        elif moving_task_index is not None:
-            instruction = "Moving task. Use arrows to reposition. Space to confirm."
-        else:
-            instruction = ("a=add, Del=remove, space=move, d=done, e=edit, o=order, "
-                           "/=search, g=sync, G=OAuth test, q=quit")
-        try:
-            stdscr.addstr(max_y - 2, 0, " " * (max_x - 1))
-            stdscr.addstr(max_y - 2, 0, instruction[:max_x-1])
-        except curses.error:
-            pass
+                highlight = search_mode and bool(search_query) and search_query.lower() in text.lower()
+                row_key = (text_part, details_part, date_part, days_field, status,
+                           text_style, details_style, date_style, status_style,
+                           search_query.lower() if highlight else None)
+                if prev_rows.get(row) == row_key:
+                    continue
+                prev_rows[row] = row_key
 
-        stdscr.refresh()
+                try:
+                    stdscr.hline(row + 1, 0, ord('-'), max_x - 1)
+                    x_status = x_date + date_w + len(days_field)
+                    # One write for the whole row, then recolour the spans in place
+                    stdscr.move(row, 0)
+                    stdscr.clrtoeol()
+                    stdscr.addnstr(row, 0, text_part + details_part + date_part + days_field + status,
+                                   max_x, details_style)
+                    stdscr.chgat(row, 0, text_w, text_style)
+                    if highlight:
+                        prefix_w = text_w - cell_width(text)
+                        lower_text = text.lower()
+                        lower_q = search_query.lower()
+                        match_pos = lower_text.find(lower_q)
+                        while match_pos != -1:
+                            match_end = match_pos + len(search_query)
+                            stdscr.chgat(row, prefix_w + cell_width(text[:match_pos]),
+                                         cell_width(text[match_pos:match_end]), color_match)
+                            match_pos = lower_text.find(lower_q, match_end)
+                    stdscr.chgat(row, x_date, x_status - x_date, date_style)
+                    stdscr.chgat(row, x_status, len(status), status_style)
+                except curses.error:
+                    pass
+
+            # Blank rows left over from tasks that scrolled away or were deleted
+            drawn_rows = (min(num_tasks, scroll_offset + visible_tasks) - scroll_offset) * 2
+            for row in [r for r in prev_rows if r >= drawn_rows]:
+                del prev_rows[row]
+                for y in (row, row + 1):
+                    stdscr.move(y, 0)
+                    stdscr.clrtoeol()
+
+            if search_mode:
+                search_line = f"/{search_query}"
+                match_info = f"  [{search_match_idx+1}/{len(search_matches)}]" if search_matches else "  [no matches]"
+                instruction = search_line + match_info
+            elif moving_task_index is not None:
+                instruction = "Moving task. Use arrows to reposition. Space to confirm."
+            else:
+                instruction = ("a=add, Del=remove, space=move, d=done, e=edit, o=order, "
+                               "/=search, g=sync, G=OAuth test, q=quit")
+            if instruction != prev_instruction:
+                prev_instruction = instruction
+                try:
+                    stdscr.addstr(max_y - 2, 0, " " * (max_x - 1))
+                    stdscr.addstr(max_y - 2, 0, instruction[:max_x-1])
+                except curses.error:
+                    pass
+            if status_line != prev_status_line:
+                prev_status_line = status_line
+                try:
+                    stdscr.move(max_y - 1, 0)
+                    stdscr.clrtoeol()
+                    stdscr.addstr(max_y - 1, 0, status_line.replace('\n', ' ')[:max_x-1])
+                except curses.error:
+                    pass
+
+            stdscr.noutrefresh()
+            curses.doupdate()
+            dirty_ui = False
+        # Wake up periodically: often while a sync runs so its progress gets drawn,
+        # otherwise once a second so the due labels roll over at midnight unprompted
+        stdscr.timeout(100 if sync_thread is not None else 1000)
         key = stdscr.getch()
+        if key == -1:
+            if datetime.date.today() != meta_day:
+                dirty_ui = True
+            continue
+        # A paint skipped for queued input is still owed; unbound keys restore this
+        paint_owed = dirty_ui
+        dirty_ui = True
 
         # --- Search mode input handling ---
         if search_mode:
@@ -925,11 +1366,21 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
                         scroll_offset = current_selection - visible_tasks + 1
                 else:
                     search_match_idx = 0
+            else:
+                dirty_ui = paint_owed
             continue
 
+        if sync_thread is not None and key in sync_locked_keys:
+            curses.flash()
+            dirty_ui = paint_owed
+            continue
         if key == ord('q'):
+            if sync_thread is not None:
+                notify_popup(stdscr, "Waiting for Google sync to finish…", wait_for_key=False)
+                sync_thread.join()
             break
         elif key == curses.KEY_RESIZE:
+            full_redraw = True
             continue
         elif key == curses.KEY_UP:
             if moving_task_index is None:
@@ -951,6 +1402,7 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
                     current_selection = moving_task_index
         elif key == ord('o') and moving_task_index is None:
             order_choice = input_task(stdscr, "Order by (t) task or (d) date? ").strip().lower()
+            full_redraw = True
             if order_choice == 't':
                 current_order = 'pos'
             elif order_choice == 'd':
@@ -959,19 +1411,30 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
             scroll_offset = 0
         elif key == ord('a') and moving_task_index is None:
             new_task = new_task_dialog(stdscr)
+            full_redraw = True
             if new_task is not None:
                 task_text, task_date, task_details = new_task
                 task_date = normalize_date(task_date)
-                add_task(conn, task_text, task_date, task_details, mark_dirty=True)
-                tasks = get_tasks(conn, current_order)
+                with conn:
+                    task_id = add_task(conn, task_text, task_date, task_details, mark_dirty=True)
+                if current_order == 'pos':
+                    # add_task gives it MAX(pos) + 1, so it goes last
+                    new_pos = tasks[-1][2] + 1 if tasks else 0
+                    tasks.append((task_id, task_text, new_pos, task_date, task_details, 0))
+                else:
+                    tasks = task_cache = get_tasks(conn, current_order)
                 current_selection = len(tasks) - 1
                 if current_selection >= scroll_offset + visible_tasks:
                     scroll_offset = current_selection - visible_tasks + 1
         elif key in (curses.KEY_DC, curses.KEY_BACKSPACE, 127) and moving_task_index is None:
             if num_tasks > 0:
                 task_id = tasks[current_selection][0]
-                delete_task(conn, task_id, mark_dirty=True)
-                tasks = get_tasks(conn, current_order)
+                with conn:
+                    delete_task(conn, task_id, mark_dirty=True)
+                deleted_pos = tasks[current_selection][2]
+                del tasks[current_selection]
+                # Mirror delete_task closing the pos gap
+                tasks[:] = [(t[0], t[1], t[2] - 1, *t[3:]) if t[2] > deleted_pos else t for t in tasks]
                 if current_selection >= len(tasks):
                     current_selection = max(0, len(tasks) - 1)
                 scroll_offset = 0
@@ -979,25 +1442,37 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
             if num_tasks > 0:
                 task = tasks[current_selection]
                 task_id, _, _, _, _, done = task
-                toggle_task_done(conn, task_id, done)
+                with conn:
+                    toggle_task_done(conn, task_id)
+                # done is not part of either ORDER BY, so patch the cached row in place
+                tasks[current_selection] = (*task[:5], 1 - done)
         elif key in (ord('e'), curses.KEY_ENTER, 10, 13) and moving_task_index is None:
             if num_tasks > 0:
                 task = tasks[current_selection]
                 task_id, text, pos, comp_date, details, done = task
                 edited = edit_task_dialog(stdscr, text, comp_date, details)
+                full_redraw = True
                 if edited is not None:
                     new_text, new_date, new_details = edited
                     new_date = normalize_date(new_date)
-                    update_task_info(conn, task_id, new_text, new_date, new_details)
+                    with conn:
+                        update_task_info(conn, task_id, new_text, new_date, new_details)
+                    if current_order == 'pos':
+                        tasks[current_selection] = (task_id, new_text, pos, new_date, new_details, done)
+                    else:
+                        invalidate_task_cache()  # the new date may move the row
         elif key == ord(' '):
             if current_order != 'pos':
                 curses.flash()
             else:
                 if moving_task_index is None:
-                    reorder_list = get_tasks(conn, current_order)
+                    reorder_list = list(tasks)
                     moving_task_index = current_selection
                 else:
-                    update_task_order(conn, reorder_list)
+                    with conn:
+                        update_task_order(conn, reorder_list)
+                    task_cache = [(t[0], t[1], i, *t[3:]) for i, t in enumerate(reorder_list)]
+                    task_cache_order = 'pos'
                     current_selection = moving_task_index
                     moving_task_index = None
                     reorder_list = None
@@ -1007,15 +1482,31 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
             search_matches = []
             search_match_idx = 0
             pre_search_selection = current_selection
-        elif key == ord('g'):  # sync with Google
+        elif key == ord('g') and moving_task_index is None:  # sync with Google in the background
             try:
                 notify_popup(stdscr, "Starting Google sync…\n(May open a browser on first run)", wait_for_key=False)
-                full_sync(conn, stdscr, client_secret_path, token_path)
-                notify_popup(stdscr, "Sync complete.")
+                client_secret = _find_client_secret(client_secret_path)
+                token_file = _find_token_path(token_path)
+                # First run (or no client secret) needs popups and a browser, so connect here;
+                # otherwise the sync thread loads and refreshes the token itself
+                needs_ui = (_cached_service(client_secret, token_file) is None
+                            and (client_secret is None or not os.path.exists(token_file)))
+                if needs_ui and get_google_service(stdscr, client_secret_path, token_path) is None:
+                    notify_popup(stdscr, "Google service unavailable (OAuth not done?).")
+                else:
+                    status_line = "Syncing with Google…"
+                    sync_thread = threading.Thread(
+                        target=full_sync_in_background,
+                        args=(db_path, client_secret_path, token_path, sync_status),
+                        daemon=True)
+                    sync_thread.start()
             except Exception as e:
                 log_exception(e)
                 notify_popup(stdscr, f"Sync error:\n{e}\nSee {DEBUG_LOG}")
+            full_redraw = True
         elif key == ord('G'):  # force OAuth/connect test
+            full_redraw = True
+            _service_cache.clear()  # reconnect from the token file (or browser), not from this session's service
             svc = get_google_service(stdscr, client_secret_path, token_path)
             if svc:
                 try:
@@ -1024,6 +1515,8 @@ def main(stdscr, db_path, client_secret_path=None, token_path=None):
                 except Exception as e:
                     log_exception(e)
                     notify_popup(stdscr, f"Connected but API check failed:\n{e}\nSee {DEBUG_LOG}")
+        else:
+            dirty_ui = paint_owed  # unbound key (or one disabled while moving): nothing new to repaint
 
     conn.close()
 
@@ -0,0 +1,26 @@
+import unittest
+
+import tasks
+
+
+class ParseMmddTest(unittest.TestCase):
+    def test_valid_date(self):
+        self.assertEqual(tasks.parse_mmdd('12/31'), (12, 31))
+        self.assertEqual(tasks.parse_mmdd('02/29', 2028), (2, 29))
+
+    def test_invalid_dates(self):
+        for value in ('', 'x', '13/01', '02/30', '1/2/3', None):
+            self.assertIsNone(tasks.parse_mmdd(value), value)
+
+    def test_oversized_numbers(self):
+        # int() accepts any length; datetime.date raises OverflowError past C long
+        self.assertIsNone(tasks.parse_mmdd('99999999999999999999/1'))
+        self.assertIsNone(tasks.mmdd_to_rfc3339('99999999999999999999/1'))
+        self.assertIsNone(tasks.mmdd_to_rfc3339('1/99999999999999999999', 2026))
+
+    def test_rfc3339(self):
+        self.assertEqual(tasks.mmdd_to_rfc3339('03/04', 2026), '2026-03-04T00:00:00Z')
+
+
+if __name__ == '__main__':
+    unittest.main()